@@ -1,6 +1,46 @@
+import mmap
+import os
 import sys
+import time
+from functools import reduce
+from multiprocessing import Pool
 
-def solve(input_file):
+DIAL_SIZE = 100
+START_POSITION = 50
+CHUNK_SIZE = 1 << 20  # multiple of mmap.PAGESIZE, so chunk offsets stay page aligned
+
+
+def rotate(position, direction, distance):
+    """
+    Apply one rotation to the dial in O(1).
+
+    Returns the new position and the number of clicks that landed on 0
+    along the way (including the final click). Moving left from position p
+    is the mirror image of moving right from (DIAL_SIZE - p) % DIAL_SIZE, so
+    both directions reduce to counting multiples of DIAL_SIZE in a range.
+    """
+    if direction == 'L':
+        hits = ((DIAL_SIZE - position) % DIAL_SIZE + distance) // DIAL_SIZE
+        return (position - distance) % DIAL_SIZE, hits
+
+    hits = (position + distance) // DIAL_SIZE
+    return (position + distance) % DIAL_SIZE, hits
+
+
+def rotate_stepwise(position, direction, distance):
+    """Reference implementation of rotate() that moves one click at a time."""
+    step = -1 if direction == 'L' else 1
+    hits = 0
+
+    for _ in range(distance):
+        position = (position + step) % DIAL_SIZE
+        if position == 0:
+            hits += 1
+
+    return position, hits
+
+
+def solve(input_file, stepwise=False):
     try:
         with open(input_file, 'r') as f:
             lines = f.readlines()
@@ -8,7 +48,9 @@ def solve(input_file):
         print(f"Error: File {input_file} not found.")
         return
 
-    dial_position = 50
+    apply_rotation = rotate_stepwise if stepwise else rotate
+
+    dial_position = START_POSITION
     part1_zero_count = 0
     part2_zero_count = 0
 
@@ -16,27 +58,251 @@ def solve(input_file):
         line = line.strip()
         if not line:
             continue
-        
+
         direction = line[0]
         distance = int(line[1:])
 
-        step = -1 if direction == 'L' else 1
-        
-        for _ in range(distance):
-            dial_position = (dial_position + step) % 100
-            if dial_position == 0:
-                part2_zero_count += 1
-        
+        dial_position, hits = apply_rotation(dial_position, direction, distance)
+        part2_zero_count += hits
+
         if dial_position == 0:
             part1_zero_count += 1
 
     print(f"Part 1 Password: {part1_zero_count}")
     print(f"Part 2 Password: {part2_zero_count}")
 
+    return part1_zero_count, part2_zero_count
+
+
+def iter_chunks(input_file, chunk_size=CHUNK_SIZE, start=0, end=None):
+    """
+    Yield the raw bytes of a rotation log in chunks of at most chunk_size.
+
+    A path of '-' reads from stdin. Files are memory-mapped and the pages
+    behind the cursor are released after each chunk, so resident memory
+    stays around one chunk no matter how large the log is. start and end
+    restrict a file to the byte range [start, end).
+    """
+    if input_file == '-':
+        read = sys.stdin.buffer.read
+        while True:
+            chunk = read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    with open(input_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        end = size if end is None else min(end, size)
+        if start >= end:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            for offset in range(start, end, chunk_size):
+                length = min(chunk_size, end - offset)
+                yield mm[offset:offset + length]
+                if hasattr(mmap, 'MADV_DONTNEED'):
+                    page_start = offset - offset % mmap.PAGESIZE
+                    mm.madvise(mmap.MADV_DONTNEED, page_start, offset + length - page_start)
+
+
+def iter_rotations(chunks):
+    """
+    Parse (direction, distance) pairs from an iterable of byte chunks.
+
+    A token cut in half by a chunk boundary is carried over and joined with
+    the start of the next chunk.
+    """
+    pending = b''
+
+    for chunk in chunks:
+        tokens = (pending + chunk).split()
+        if tokens and not chunk[-1:].isspace():
+            pending = tokens.pop()
+        else:
+            pending = b''
+
+        for token in tokens:
+            yield ('L' if token[:1] == b'L' else 'R'), int(token[1:])
+
+    if pending:
+        yield ('L' if pending[:1] == b'L' else 'R'), int(pending[1:])
+
+
+def solve_stream(input_file, chunk_size=CHUNK_SIZE):
+    """Solve both parts in a single streaming pass with constant memory."""
+    try:
+        chunks = iter_chunks(input_file, chunk_size)
+        dial_position = START_POSITION
+        part1_zero_count = 0
+        part2_zero_count = 0
+        instructions = 0
+        started = time.perf_counter()
+
+        for direction, distance in iter_rotations(chunks):
+            dial_position, hits = rotate(dial_position, direction, distance)
+            part2_zero_count += hits
+            if dial_position == 0:
+                part1_zero_count += 1
+            instructions += 1
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        return
+
+    elapsed = time.perf_counter() - started
+    rate = instructions / elapsed if elapsed > 0 else float('inf')
+
+    print(f"Part 1 Password: {part1_zero_count}")
+    print(f"Part 2 Password: {part2_zero_count}")
+    print(f"Processed {instructions} instructions in {elapsed:.3f}s ({rate:,.0f} instructions/sec)")
+
+    return part1_zero_count, part2_zero_count
+
+
+# A segment summarises a run of rotations independently of where the dial
+# starts: (offset, landings, crossings), where offset is the net movement
+# mod DIAL_SIZE and landings[s] / crossings[s] are the Part 1 / Part 2 zero
+# counts the run produces when it starts at position s. Segments compose
+# associatively, so chunks can be summarised in parallel and folded in order.
+IDENTITY_SEGMENT = (0, (0,) * DIAL_SIZE, (0,) * DIAL_SIZE)
+
+
+def summarize_rotations(rotations):
+    """Build the segment for a run of rotations in O(len(rotations) + DIAL_SIZE)."""
+    offset = 0
+    full_turns = 0
+    landings = [0] * DIAL_SIZE
+    # Difference array over start positions for the partial-turn crossings
+    partial = [0] * (DIAL_SIZE + 1)
+
+    for direction, distance in rotations:
+        full_turns += distance // DIAL_SIZE
+        remainder = distance % DIAL_SIZE
+
+        # With the dial at q = (s + offset) % DIAL_SIZE before this rotation,
+        # the remainder clicks pass 0 once more iff q is in [low, high].
+        if direction == 'L':
+            low, high = 1, remainder
+            next_offset = (offset - distance) % DIAL_SIZE
+        else:
+            low, high = DIAL_SIZE - remainder, DIAL_SIZE - 1
+            next_offset = (offset + distance) % DIAL_SIZE
+
+        if remainder:
+            first = (low - offset) % DIAL_SIZE
+            last = (high - offset) % DIAL_SIZE
+            partial[first] += 1
+            partial[last + 1] -= 1
+            if first > last:
+                # The range of start positions wraps around past 0
+                partial[0] += 1
+                partial[DIAL_SIZE] -= 1
+
+        offset = next_offset
+        landings[-offset % DIAL_SIZE] += 1
+
+    crossings = []
+    running = full_turns
+    for s in range(DIAL_SIZE):
+        running += partial[s]
+        crossings.append(running)
+
+    return offset, tuple(landings), tuple(crossings)
+
+
+def combine_segments(first, second):
+    """Compose two segments, with first applied before second."""
+    first_offset, first_landings, first_crossings = first
+    second_offset, second_landings, second_crossings = second
+
+    landings = tuple(
+        first_landings[s] + second_landings[(s + first_offset) % DIAL_SIZE]
+        for s in range(DIAL_SIZE)
+    )
+    crossings = tuple(
+        first_crossings[s] + second_crossings[(s + first_offset) % DIAL_SIZE]
+        for s in range(DIAL_SIZE)
+    )
+    return (first_offset + second_offset) % DIAL_SIZE, landings, crossings
+
+
+def split_file(input_file, parts):
+    """Split a file into at most `parts` byte ranges that end on a newline."""
+    size = os.path.getsize(input_file)
+    if size == 0:
+        return []
+
+    boundaries = [0]
+    with open(input_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            target = max(size * i // parts, boundaries[-1])
+            newline = mm.find(b'\n', target)
+            if newline == -1:
+                break
+            if newline + 1 > boundaries[-1]:
+                boundaries.append(newline + 1)
+    if boundaries[-1] < size:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def summarize_file_range(task):
+    """Pool worker: summarise the rotations in one byte range of a file."""
+    input_file, start, end = task
+    return summarize_rotations(iter_rotations(iter_chunks(input_file, CHUNK_SIZE, start, end)))
+
+
+def solve_parallel(input_file, processes=None, chunks_per_process=4):
+    """Solve both parts by summarising file chunks on all cores and folding the segments."""
+    if input_file == '-':
+        print("Error: parallel mode needs a seekable file, not stdin.")
+        return
+
+    try:
+        processes = processes or os.cpu_count() or 1
+        started = time.perf_counter()
+        tasks = [
+            (input_file, start, end)
+            for start, end in split_file(input_file, processes * chunks_per_process)
+        ]
+    except FileNotFoundError:
+        print(f"Error: File {input_file} not found.")
+        return
+
+    with Pool(processes) as pool:
+        segments = pool.imap(summarize_file_range, tasks)
+        _, landings, crossings = reduce(combine_segments, segments, IDENTITY_SEGMENT)
+
+    elapsed = time.perf_counter() - started
+    part1_zero_count = landings[START_POSITION]
+    part2_zero_count = crossings[START_POSITION]
+
+    print(f"Part 1 Password: {part1_zero_count}")
+    print(f"Part 2 Password: {part2_zero_count}")
+    print(f"Summarised {len(tasks)} chunks on {processes} processes in {elapsed:.3f}s")
+
+    return part1_zero_count, part2_zero_count
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        input_file = sys.argv[1]
+    args = sys.argv[1:]
+    flags = {'--stepwise', '--stream', '--parallel'}
+    stepwise = '--stepwise' in args
+    stream = '--stream' in args
+    parallel = '--parallel' in args
+    args = [arg for arg in args if arg not in flags]
+
+    if args:
+        input_file = args[0]
     else:
         input_file = "input.txt"
-    
-    solve(input_file)
+
+    if parallel:
+        solve_parallel(input_file)
+    elif stream:
+        solve_stream(input_file)
+    else:
+        solve(input_file, stepwise=stepwise)
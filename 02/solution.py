@@ -4,6 +4,18 @@ Advent of Code 2025 - Day 2: Gift Shop
 Find and sum all invalid product IDs across given ranges.
 An ID is invalid if it's made of a sequence of digits repeated exactly twice.
 """
+import csv
+import heapq
+import json
+import sys
+import time
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for invalid_id_mask
+    np = None
+
 
 def is_invalid_id(num, part=2):
     """
@@ -42,8 +54,112 @@ def is_invalid_id(num, part=2):
         return False
 
 
+def repeat_multiplier(pattern_len, repeats):
+    """
+    Multiplier that repeats a pattern_len-digit pattern `repeats` times.
+    Examples: (1, 2) -> 11, (2, 2) -> 101, (3, 2) -> 1001, (2, 3) -> 10101
+    """
+    return sum(10 ** (pattern_len * i) for i in range(repeats))
+
+
+def generate_invalid_ids(start, end, part=2):
+    """
+    Generate all invalid IDs in [start, end] in ascending order, without
+    scanning the range.
+
+    Every invalid ID of length L is pattern * repeat_multiplier(p, L // p)
+    for some pattern length p dividing L, so for each (L, p) we only need the
+    range of p-digit patterns whose product falls inside [start, end].
+    Each of those series is already ascending, so the series of one length
+    are merged lazily with heapq.merge. In Part 2 an ID can have several
+    periods (e.g. 111111 is 1, 11 and 111 repeated), so consecutive
+    duplicates of the merged stream are skipped. Nothing is materialised:
+    memory is O(number of periods) and the first ID comes out immediately.
+    """
+    start = max(start, 1)
+    if start > end:
+        return
+
+    for length in range(len(str(start)), len(str(end)) + 1):
+        if part == 1:
+            pattern_lens = [length // 2] if length % 2 == 0 else []
+        else:
+            pattern_lens = [p for p in range(1, length // 2 + 1) if length % p == 0]
+
+        series = []
+        for pattern_len in pattern_lens:
+            multiplier = repeat_multiplier(pattern_len, length // pattern_len)
+            lowest = max(10 ** (pattern_len - 1), -(-start // multiplier))
+            highest = min(10 ** pattern_len - 1, end // multiplier)
+            series.append(map(multiplier.__mul__, range(lowest, highest + 1)))
+
+        previous = None
+        for invalid_id in heapq.merge(*series):
+            if invalid_id != previous:
+                yield invalid_id
+                previous = invalid_id
+
+
+def invalid_id_stats(start, end, part=2):
+    """
+    Return (count, sum) of the invalid IDs in [start, end] without
+    enumerating them.
+
+    For each ID length L and pattern length p, the IDs with period p form an
+    arithmetic series pattern * multiplier over a contiguous range of
+    patterns. In Part 2 an ID with period d also has period p for every
+    multiple p of d, so series are reduced to IDs whose smallest period is
+    exactly p by subtracting the divisors' totals (inclusion-exclusion).
+    Cost is polylogarithmic in the size of the range.
+    """
+    start = max(start, 1)
+    if start > end:
+        return 0, 0
+
+    total_count = 0
+    total_sum = 0
+
+    for length in range(len(str(start)), len(str(end)) + 1):
+        if part == 1:
+            pattern_lens = [length // 2] if length % 2 == 0 else []
+        else:
+            pattern_lens = [p for p in range(1, length // 2 + 1) if length % p == 0]
+
+        # Totals for IDs whose smallest period is exactly pattern_len
+        primitive = {}
+        for pattern_len in pattern_lens:
+            multiplier = repeat_multiplier(pattern_len, length // pattern_len)
+            lowest = max(10 ** (pattern_len - 1), -(-start // multiplier))
+            highest = min(10 ** pattern_len - 1, end // multiplier)
+
+            count = max(highest - lowest + 1, 0)
+            series_sum = multiplier * (lowest + highest) * count // 2
+
+            if part != 1:
+                for divisor, (divisor_count, divisor_sum) in primitive.items():
+                    if pattern_len % divisor == 0:
+                        count -= divisor_count
+                        series_sum -= divisor_sum
+
+            primitive[pattern_len] = (count, series_sum)
+            total_count += count
+            total_sum += series_sum
+
+    return total_count, total_sum
+
+
+def sum_invalid_ids(start, end, part=2):
+    """Sum of all invalid IDs in [start, end], computed in closed form."""
+    return invalid_id_stats(start, end, part=part)[1]
+
+
 def find_invalid_ids_in_range(start, end, part=2):
     """Find all invalid IDs in the given range [start, end] inclusive."""
+    return list(generate_invalid_ids(start, end, part=part))
+
+
+def find_invalid_ids_in_range_bruteforce(start, end, part=2):
+    """Reference implementation that tests every ID in [start, end] with is_invalid_id."""
     invalid_ids = []
     for num in range(start, end + 1):
         if is_invalid_id(num, part=part):
@@ -51,18 +167,95 @@ def find_invalid_ids_in_range(start, end, part=2):
     return invalid_ids
 
 
-def solve(input_file, part=2):
-    """Solve the puzzle given the input file path."""
-    # Read the input
+def invalid_id_mask(ids, part=2):
+    """
+    Vectorized is_invalid_id: take an array of non-negative IDs and return a
+    boolean mask of the invalid ones.
+
+    IDs are bucketed by digit count L. Within a bucket, an ID n has period p
+    exactly when n == (n // 10**(L - p)) * repeat_multiplier(p, L // p),
+    i.e. when its leading pattern repeated fills the whole number, so each
+    (L, p) pair costs a couple of whole-bucket integer operations.
+    """
+    if np is None:
+        raise ImportError("invalid_id_mask requires NumPy")
+
+    ids = np.asarray(ids, dtype=np.int64)
+    mask = np.zeros(ids.shape, dtype=bool)
+
+    # Digit count of every ID (0 and negatives stay at 0 digits and are never invalid)
+    powers = np.array([10 ** i for i in range(19)], dtype=np.int64)
+    lengths = np.searchsorted(powers, ids, side='right')
+
+    for length in np.unique(lengths):
+        length = int(length)
+        if length < 2:
+            continue
+        if part == 1:
+            pattern_lens = [length // 2] if length % 2 == 0 else []
+        else:
+            pattern_lens = [p for p in range(1, length // 2 + 1) if length % p == 0]
+        if not pattern_lens:
+            continue
+
+        in_bucket = lengths == length
+        bucket = ids[in_bucket]
+        bucket_mask = np.zeros(bucket.shape, dtype=bool)
+
+        for pattern_len in pattern_lens:
+            multiplier = repeat_multiplier(pattern_len, length // pattern_len)
+            leading = bucket // (10 ** (length - pattern_len))
+            bucket_mask |= leading * multiplier == bucket
+
+        mask[in_bucket] = bucket_mask
+
+    return mask
+
+
+def benchmark_mask(num_ids=10**8, part=2, batch_size=10**7, scalar_sample=10**6):
+    """
+    Compare invalid_id_mask against the scalar is_invalid_id on num_ids
+    consecutive IDs. The NumPy path runs over all of them in batches; the
+    scalar path is timed on the first scalar_sample IDs and extrapolated.
+    """
+    start = 10 ** 9
+    vector_count = 0
+    started = time.perf_counter()
+    for batch_start in range(start, start + num_ids, batch_size):
+        batch_end = min(batch_start + batch_size, start + num_ids)
+        vector_count += int(invalid_id_mask(np.arange(batch_start, batch_end), part=part).sum())
+    vector_time = time.perf_counter() - started
+
+    sample = min(scalar_sample, num_ids)
+    started = time.perf_counter()
+    scalar_count = sum(1 for n in range(start, start + sample) if is_invalid_id(n, part=part))
+    scalar_time = (time.perf_counter() - started) * num_ids / sample
+
+    sample_mask = invalid_id_mask(np.arange(start, start + sample), part=part)
+    assert int(sample_mask.sum()) == scalar_count, "vectorized and scalar results differ"
+
+    print(f"{num_ids} IDs, part {part}: {vector_count} invalid")
+    print(f"NumPy mask:   {vector_time:.2f}s")
+    print(f"Scalar check: {scalar_time:.2f}s (extrapolated from {sample} IDs)")
+    print(f"Speedup:      {scalar_time / vector_time:.1f}x")
+
+
+def parse_ranges(input_file):
+    """Parse the comma-separated start-end ranges from the input file."""
     with open(input_file, 'r') as f:
         data = f.read().strip()
-    
-    # Parse the ranges
+
     ranges = []
     for range_str in data.split(','):
         range_str = range_str.strip()
         start, end = range_str.split('-')
         ranges.append((int(start), int(end)))
+    return ranges
+
+
+def solve(input_file, part=2):
+    """Solve the puzzle given the input file path."""
+    ranges = parse_ranges(input_file)
     
     # Find all invalid IDs
     all_invalid_ids = []
@@ -81,8 +274,80 @@ def solve(input_file, part=2):
     return total
 
 
+def solve_summary(input_file, part=2, report_format='json', sample=0, out=None):
+    """
+    Solve the puzzle without materialising or printing any ID lists.
+
+    Writes one compact report row per range (start, end, count, sum) as JSON
+    or CSV to `out` (stdout by default). With sample > 0, each row also
+    carries the first `sample` invalid IDs of its range for debugging,
+    taken lazily from generate_invalid_ids so sampling costs O(sample)
+    whatever the size of the range.
+    """
+    out = out or sys.stdout
+    ranges = parse_ranges(input_file)
+
+    rows = []
+    total_count = 0
+    total = 0
+    for start, end in ranges:
+        count, range_sum = invalid_id_stats(start, end, part=part)
+        row = {'start': start, 'end': end, 'count': count, 'sum': range_sum}
+        if sample > 0:
+            row['sample'] = list(islice(generate_invalid_ids(start, end, part=part), min(sample, count)))
+        rows.append(row)
+        total_count += count
+        total += range_sum
+
+    if report_format == 'csv':
+        fields = ['start', 'end', 'count', 'sum'] + (['sample'] if sample > 0 else [])
+        writer = csv.DictWriter(out, fieldnames=fields, lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            if sample > 0:
+                row = dict(row, sample=' '.join(map(str, row['sample'])))
+            writer.writerow(row)
+    else:
+        report = {'part': part, 'count': total_count, 'sum': total, 'ranges': rows}
+        json.dump(report, out, separators=(',', ':'))
+        out.write('\n')
+
+    return total
+
+
+
+def main_summary(args):
+    """Command line entry point for the summary report mode."""
+    part = 2
+    report_format = 'json'
+    sample = 0
+    input_file = "input.txt"
+
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if arg == '--part':
+            part = int(args.pop(0))
+        elif arg == '--csv':
+            report_format = 'csv'
+        elif arg == '--sample':
+            sample = int(args.pop(0))
+        else:
+            input_file = arg
+
+    solve_summary(input_file, part=part, report_format=report_format, sample=sample)
+
 
 if __name__ == "__main__":
+    if '--summary' in sys.argv[1:]:
+        main_summary(arg for arg in sys.argv[1:] if arg != '--summary')
+        sys.exit(0)
+
+    if '--benchmark-mask' in sys.argv[1:]:
+        counts = [int(arg) for arg in sys.argv[1:] if arg.isdigit()]
+        benchmark_mask(*counts[:1])
+        sys.exit(0)
+
     # Test with the examples from the problem
     print("=== Testing Part 1 (exactly twice) ===")
     test_cases_part1 = [
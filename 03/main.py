@@ -1,8 +1,192 @@
+import os
+import sys
+from array import array
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+
 def find_max_joltage(bank, k):
     """
     Find the maximum k-digit number by selecting k batteries from the bank.
-    Uses a greedy approach: at each position, select the largest digit that
-    still allows selecting enough remaining digits.
+
+    Single O(n) pass with a monotonic stack over the bank's bytes: a smaller
+    digit is dropped whenever a larger one follows and we can still afford
+    to drop digits (at most n - k in total).
+    """
+    if isinstance(bank, str):
+        bank = bank.encode()
+    n = len(bank)
+    if k > n:
+        return 0
+
+    drops = n - k
+    stack = bytearray()
+    for digit in bank:
+        while drops and stack and stack[-1] < digit:
+            stack.pop()
+            drops -= 1
+        stack.append(digit)
+
+    return int(stack[:k])
+
+
+def find_max_joltages(bank, ks):
+    """
+    Find the maximum joltage for several values of k in one pass over the bank.
+    Returns a dict mapping each k to its result.
+    """
+    if isinstance(bank, str):
+        bank = bank.encode()
+    n = len(bank)
+    results = {k: 0 for k in ks}
+    ks = [k for k in results if k <= n]
+
+    drops = {k: n - k for k in ks}
+    stacks = {k: bytearray() for k in ks}
+    for digit in bank:
+        for k in ks:
+            stack = stacks[k]
+            while drops[k] and stack and stack[-1] < digit:
+                stack.pop()
+                drops[k] -= 1
+            stack.append(digit)
+
+    results.update((k, int(stacks[k][:k])) for k in ks)
+    return results
+
+
+# Maps ASCII digits to their values, so a bank converts to array('b') in C
+DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+
+class BankIndex:
+    """
+    Reusable index over one bank for repeated max-joltage queries.
+
+    Digits live in a compact array('b'), split into blocks of BLOCK_SIZE
+    digits and superblocks of SUPER_BLOCKS blocks. Each block keeps its max
+    digit and that digit's offset in a byte apiece, and a sparse table of
+    positions is kept only over the superblocks. That is 2/64 of a byte per
+    digit plus at most n/16 bytes of table for any bank under 2**64 digits,
+    so the index is O(n) on top of the digits. A range argmax scans at most
+    two partial blocks and two partial runs of block maxima and does two
+    table lookups, so a query for k digits costs O(k) with no rescanning.
+    """
+
+    BLOCK_SIZE = 64
+    SUPER_BLOCKS = 64
+
+    def __init__(self, bank):
+        if isinstance(bank, str):
+            bank = bank.encode()
+        self.digits = array('b', bank.translate(DIGIT_VALUES))
+        n = len(self.digits)
+        size = self.BLOCK_SIZE
+
+        self.block_max = array('b')
+        self.block_offset = array('B')
+        for lo in range(0, n, size):
+            window = self.digits[lo:lo + size]
+            best = max(window)
+            self.block_max.append(best)
+            self.block_offset.append(window.index(best))
+
+        blocks = len(self.block_max)
+        supers = array('I', (
+            self.scan_blocks(lo, min(lo + self.SUPER_BLOCKS, blocks) - 1)
+            for lo in range(0, blocks, self.SUPER_BLOCKS)
+        ))
+
+        digits = self.digits
+        self.table = [supers]
+        width = 1
+        while 2 * width <= len(supers):
+            prev = self.table[-1]
+            level = array('I', (
+                left if digits[left] >= digits[right] else right
+                for left, right in zip(prev, prev[width:])
+            ))
+            self.table.append(level)
+            width *= 2
+
+    def __len__(self):
+        return len(self.digits)
+
+    def scan(self, lo, hi):
+        """Leftmost position of the largest digit in digits[lo:hi + 1], by direct scan."""
+        window = self.digits[lo:hi + 1]
+        return lo + window.index(max(window))
+
+    def scan_blocks(self, first, last):
+        """Leftmost position of the largest digit in blocks first..last, by scanning block maxima."""
+        window = self.block_max[first:last + 1]
+        block = first + window.index(max(window))
+        return block * self.BLOCK_SIZE + self.block_offset[block]
+
+    def argmax_blocks(self, first, last):
+        """Candidate positions, left to right, covering the full blocks first..last."""
+        run = self.SUPER_BLOCKS
+        first_super = -(-first // run)
+        last_super = (last + 1) // run - 1
+        if first_super > last_super:
+            return [self.scan_blocks(first, last)]
+
+        candidates = []
+        if first < first_super * run:
+            candidates.append(self.scan_blocks(first, first_super * run - 1))
+        level = (last_super - first_super + 1).bit_length() - 1
+        candidates.append(self.table[level][first_super])
+        candidates.append(self.table[level][last_super - (1 << level) + 1])
+        if last >= (last_super + 1) * run:
+            candidates.append(self.scan_blocks((last_super + 1) * run, last))
+        return candidates
+
+    def argmax(self, lo, hi):
+        """Leftmost position of the largest digit in digits[lo:hi + 1]."""
+        size = self.BLOCK_SIZE
+        first_block = -(-lo // size)
+        last_block = (hi + 1) // size - 1
+        if first_block > last_block:
+            return self.scan(lo, hi)
+
+        # Candidates in left-to-right order; ties keep the earlier one
+        candidates = []
+        if lo < first_block * size:
+            candidates.append(self.scan(lo, first_block * size - 1))
+        candidates.extend(self.argmax_blocks(first_block, last_block))
+        if hi >= (last_block + 1) * size:
+            candidates.append(self.scan((last_block + 1) * size, hi))
+
+        best = candidates[0]
+        for pos in candidates[1:]:
+            if self.digits[pos] > self.digits[best]:
+                best = pos
+        return best
+
+    def max_joltage(self, k, start=0, end=None):
+        """
+        Maximum k-digit number selectable from digits[start:end], with the
+        same greedy as find_max_joltage_scan but one argmax per chosen digit.
+        """
+        end = len(self.digits) if end is None else end
+        if k > end - start:
+            return 0
+
+        result = 0
+        for i in range(k):
+            pos = self.argmax(start, end - (k - i))
+            result = result * 10 + self.digits[pos]
+            start = pos + 1
+
+        return result
+
+
+def find_max_joltage_scan(bank, k):
+    """
+    Reference implementation of find_max_joltage that rescans a window for
+    every chosen digit: at each position, select the largest digit that
+    still allows selecting enough remaining digits. O(n * k).
     """
     n = len(bank)
     if k > n:
@@ -44,16 +228,55 @@ def solve(input_file, k=2):
     return total_joltage
 
 
+def iter_bank_batches(input_file, batch_size):
+    """Stream banks from the input file as bytes, in lists of up to batch_size."""
+    with open(input_file, 'rb') as f:
+        banks = (line.strip() for line in f)
+        banks = (bank for bank in banks if bank)
+        while True:
+            batch = list(islice(banks, batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+def sum_bank_batch(task):
+    """Pool worker: total joltage of one batch of banks."""
+    banks, k = task
+    return sum(find_max_joltage(bank, k) for bank in banks)
+
+
+def solve_parallel(input_file, k=2, processes=None, batch_size=1024):
+    """
+    Solve without per-bank output: banks are streamed from disk in batches
+    and spread across a process pool, and only the batch totals come back.
+    At most two batches per process are in flight, so memory stays bounded
+    however large the input is.
+    """
+    processes = processes or os.cpu_count() or 1
+    total_joltage = 0
+    pending = deque()
+
+    with Pool(processes) as pool:
+        for batch in iter_bank_batches(input_file, batch_size):
+            if len(pending) >= 2 * processes:
+                total_joltage += pending.popleft().get()
+            pending.append(pool.apply_async(sum_bank_batch, ((batch, k),)))
+        while pending:
+            total_joltage += pending.popleft().get()
+
+    return total_joltage
+
+
 if __name__ == "__main__":
-    # Test with the example for Part 1
-    test_input = """987654321111111
-811111111111119
-234234234234278
-818181911112111"""
-    
-    with open('test_input.txt', 'w') as f:
-        f.write(test_input)
-    
+    if '--parallel' in sys.argv[1:]:
+        args = [arg for arg in sys.argv[1:] if arg != '--parallel']
+        input_file = args[0] if args else 'input.txt'
+        print(f"Total output joltage (Part 1): {solve_parallel(input_file, k=2)}")
+        print(f"Total output joltage (Part 2): {solve_parallel(input_file, k=12)}")
+        sys.exit(0)
+
+    # Test with the example (test_input.txt) for Part 1
     print("=== Part 1 Test ===")
     test_result = solve('test_input.txt', k=2)
     print(f"\nTest total: {test_result}")
@@ -6,6 +6,16 @@ Count how many rolls of paper can be accessed by a forklift.
 A roll can be accessed if there are fewer than 4 rolls in the 8 adjacent positions.
 """
 
+import mmap
+import os
+import shutil
+import tempfile
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the 'numpy' engine
+    np = None
+
 def count_accessible_rolls(grid):
     """
     Count rolls of paper that can be accessed by a forklift.
@@ -104,23 +114,410 @@ def count_total_removable_rolls(grid):
     return total_removed
 
 
-def solve(input_file):
+def count_total_removable_rolls_worklist(grid):
+    """
+    Same result as count_total_removable_rolls, in O(rows * cols) total.
+
+    Neighbour counts are computed once. Each round removes the current
+    frontier as a batch, exactly like the round-synchronous scan, and only
+    the neighbours of removed rolls have their counts decremented; those that
+    drop below 4 form the next round's frontier.
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+
+    # Flat grid with a one-cell border of empty space, so neighbours of any
+    # real cell are always valid indices
+    width = cols + 2
+    is_roll = [False] * (width * (rows + 2))
+    for row in range(rows):
+        line = grid[row]
+        base = (row + 1) * width + 1
+        for col in range(min(cols, len(line))):
+            if line[col] == '@':
+                is_roll[base + col] = True
+
+    offsets = [
+        -width - 1, -width, -width + 1,
+        -1,                 1,
+        width - 1,  width,  width + 1
+    ]
+
+    counts = [0] * len(is_roll)
+    frontier = []
+    for cell, roll in enumerate(is_roll):
+        if not roll:
+            continue
+        counts[cell] = sum(is_roll[cell + offset] for offset in offsets)
+        if counts[cell] < 4:
+            frontier.append(cell)
+
+    # Cells that have been removed or are already queued for removal
+    queued = [False] * len(is_roll)
+    for cell in frontier:
+        queued[cell] = True
+
+    total_removed = 0
+    while frontier:
+        total_removed += len(frontier)
+        next_frontier = []
+
+        for cell in frontier:
+            for offset in offsets:
+                neighbour = cell + offset
+                if not is_roll[neighbour] or queued[neighbour]:
+                    continue
+                counts[neighbour] -= 1
+                if counts[neighbour] < 4:
+                    queued[neighbour] = True
+                    next_frontier.append(neighbour)
+
+        frontier = next_frontier
+
+    return total_removed
+
+
+def grid_to_array(grid):
+    """Convert a list of row strings into a uint8 array with 1 for every roll."""
+    if np is None:
+        raise ImportError("the 'numpy' engine requires NumPy")
+
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    data = ''.join(line[:cols].ljust(cols, '.') for line in grid).encode()
+    cells = np.frombuffer(data, dtype=np.uint8).reshape(rows, cols)
+    return (cells == ord('@')).astype(np.uint8)
+
+
+def neighbour_counts(rolls):
+    """Number of rolls among the 8 neighbours of every cell, as eight shifted-slice additions."""
+    rows, cols = rolls.shape
+    padded = np.pad(rolls, 1)
+    counts = np.zeros((rows, cols), dtype=np.uint8)
+    for dr in (0, 1, 2):
+        for dc in (0, 1, 2):
+            if dr == 1 and dc == 1:
+                continue
+            counts += padded[dr:dr + rows, dc:dc + cols]
+    return counts
+
+
+def count_accessible_rolls_numpy(grid):
+    """Vectorized count_accessible_rolls."""
+    rolls = grid_to_array(grid)
+    return int(np.count_nonzero(rolls & (neighbour_counts(rolls) < 4)))
+
+
+def count_total_removable_rolls_numpy(grid):
+    """
+    Vectorized count_total_removable_rolls. Each round is a whole-grid mask
+    update: the accessible rolls are removed as a batch and their
+    contribution is subtracted from the neighbour counts.
+    """
+    rolls = grid_to_array(grid)
+    counts = neighbour_counts(rolls)
+    total_removed = 0
+
+    while True:
+        accessible = rolls & (counts < 4)
+        removed = int(np.count_nonzero(accessible))
+        if removed == 0:
+            break
+
+        rolls ^= accessible
+        counts -= neighbour_counts(accessible)
+        total_removed += removed
+
+    return total_removed
+
+
+def grid_to_bitrows(grid):
+    """
+    Pack every row into a Python int with bit `col` set for a roll, so one
+    machine word holds 64 cells. Rows are expected to contain only '@' and
+    '.'. Returns (bitrows, cols).
+    """
+    rows = len(grid)
+    cols = len(grid[0]) if rows > 0 else 0
+    to_bits = str.maketrans('@.', '10')
+    bitrows = []
+    for line in grid:
+        bits = line[:cols].translate(to_bits)
+        bitrows.append(int(bits[::-1], 2) if bits else 0)
+    return bitrows, cols
+
+
+def at_least_four_neighbours(above, row, below, full):
+    """
+    Bit mask of cells in `row` with 4 or more of their 8 neighbours set.
+
+    The eight shifted neighbour rows go through a carry-save adder tree:
+    two full adders and a half adder produce three weight-1 bits and three
+    weight-2 carries, and a final full adder folds the weight-1 bits into a
+    fourth carry. Weight-1 leftovers add at most 1, so the count is >= 4
+    exactly when at least two of the four weight-2 carries are set.
+    """
+    a0, a1, a2 = (above << 1) & full, above, above >> 1
+    b0, b1 = (row << 1) & full, row >> 1
+    c0, c1, c2 = (below << 1) & full, below, below >> 1
+
+    # Full adder on the row above
+    x = a0 ^ a1
+    ones_a, twos_a = x ^ a2, (a0 & a1) | (x & a2)
+    # Full adder on the row below
+    x = c0 ^ c1
+    ones_c, twos_c = x ^ c2, (c0 & c1) | (x & c2)
+    # Half adder on the left and right neighbours
+    ones_b, twos_b = b0 ^ b1, b0 & b1
+    # Carry out of the weight-1 bits
+    x = ones_a ^ ones_b
+    twos_d = (ones_a & ones_b) | (x & ones_c)
+
+    return ((twos_a | twos_b) & (twos_c | twos_d)) | (twos_a & twos_b) | (twos_c & twos_d)
+
+
+def accessible_bitrow(bitrows, r, full):
+    """Bit mask of the accessible rolls in row r."""
+    above = bitrows[r - 1] if r > 0 else 0
+    below = bitrows[r + 1] if r + 1 < len(bitrows) else 0
+    return bitrows[r] & ~at_least_four_neighbours(above, bitrows[r], below, full)
+
+
+def count_accessible_rolls_bitpacked(grid):
+    """Bit-parallel count_accessible_rolls over packed rows."""
+    bitrows, cols = grid_to_bitrows(grid)
+    full = (1 << cols) - 1
+    return sum(accessible_bitrow(bitrows, r, full).bit_count() for r in range(len(bitrows)))
+
+
+def peel_bitrows(bitrows, full, dirty, lo=0, hi=None):
+    """
+    Remove accessible rolls from bitrows[lo:hi] in round-synchronous batches
+    until none are left, starting from the given dirty rows. Rows outside
+    [lo, hi) are read as neighbours but never modified. Returns the number
+    of rolls removed and the set of rows that changed.
+    """
+    hi = len(bitrows) if hi is None else hi
+    total_removed = 0
+    changed = set()
+
+    while True:
+        removals = {}
+        for r in dirty:
+            accessible = accessible_bitrow(bitrows, r, full)
+            if accessible:
+                removals[r] = accessible
+        if not removals:
+            break
+
+        next_dirty = set()
+        for r, accessible in removals.items():
+            bitrows[r] &= ~accessible
+            total_removed += accessible.bit_count()
+            changed.add(r)
+            next_dirty.update(n for n in (r - 1, r, r + 1) if lo <= n < hi)
+        dirty = sorted(next_dirty)
+
+    return total_removed, changed
+
+
+def count_total_removable_rolls_bitpacked(grid):
+    """
+    Bit-parallel count_total_removable_rolls over packed rows. Each round
+    removes its accessible rolls as a batch; only rows next to a row that
+    changed are re-evaluated in the following round.
+    """
+    bitrows, cols = grid_to_bitrows(grid)
+    full = (1 << cols) - 1
+    total_removed, _ = peel_bitrows(bitrows, full, range(len(bitrows)))
+    return total_removed
+
+
+# Out-of-core helpers: the grid file is memory-mapped and rows are read and
+# written as packed bits one band at a time, so only a band of rows (plus a
+# one-row halo on each side) is ever held in memory.
+BYTES_TO_BITS = bytes.maketrans(b'@.', b'10')
+BITS_TO_BYTES = str.maketrans('10', '@.')
+
+
+def grid_file_shape(mm):
+    """Return (rows, cols, stride) of a rectangular grid file, stride being the bytes per line."""
+    size = len(mm)
+    first_newline = mm.find(b'\n')
+    if first_newline == -1:
+        return (1, size, size + 1) if size else (0, 0, 1)
+
+    cols = first_newline
+    if first_newline > 0 and mm[first_newline - 1:first_newline] == b'\r':
+        cols -= 1
+    stride = first_newline + 1
+    rows, remainder = divmod(size, stride)
+    if remainder == stride - 1:
+        # Last line has no trailing newline
+        rows += 1
+    elif remainder:
+        raise ValueError("tiled engine needs every row to have the same width")
+    return rows, cols, stride
+
+
+def read_bitrows(mm, first, last, rows, cols, stride):
+    """Packed rows first..last-1 of a mapped grid; rows outside the grid are empty."""
+    bitrows = []
+    for r in range(first, last):
+        if 0 <= r < rows:
+            bits = mm[r * stride:r * stride + cols].translate(BYTES_TO_BITS)
+            bitrows.append(int(bits[::-1], 2) if bits else 0)
+        else:
+            bitrows.append(0)
+    return bitrows
+
+
+def write_bitrow(mm, r, bitrow, cols, stride):
+    """Write a packed row back into a mapped grid."""
+    line = format(bitrow, f'0{cols}b')[::-1].translate(BITS_TO_BYTES)
+    mm[r * stride:r * stride + cols] = line.encode()
+
+
+def count_accessible_rolls_tiled(input_file, band_rows=1024):
+    """count_accessible_rolls over a memory-mapped grid file, one band of rows at a time."""
+    with open(input_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            rows, cols, stride = grid_file_shape(mm)
+            full = (1 << cols) - 1
+
+            accessible_count = 0
+            for first in range(0, rows, band_rows):
+                last = min(first + band_rows, rows)
+                band = read_bitrows(mm, first - 1, last + 1, rows, cols, stride)
+                accessible_count += sum(
+                    accessible_bitrow(band, r, full).bit_count()
+                    for r in range(1, last - first + 1)
+                )
+
+    return accessible_count
+
+
+def count_total_removable_rolls_tiled(input_file, band_rows=1024, work_dir=None):
+    """
+    count_total_removable_rolls for grids that do not fit in memory.
+
+    Removals are written to a scratch copy of the grid file, which is
+    memory-mapped and processed in bands of band_rows rows with a one-row
+    halo above and below. Each band is peeled to a local fixed point with
+    its halo held fixed. When a band's edge row changes, the adjacent row
+    across the boundary becomes a pending frontier row of the neighbouring
+    band, and bands are revisited until no pending rows remain. The set of
+    removable rolls does not depend on the order in which they are removed,
+    so this reaches the same global fixed point as the round-by-round scan.
+    """
+    if os.path.getsize(input_file) == 0:
+        return 0
+
+    work_dir = work_dir or os.path.dirname(os.path.abspath(input_file))
+    fd, scratch_file = tempfile.mkstemp(prefix='day04-', suffix='.grid', dir=work_dir)
+    os.close(fd)
+
+    try:
+        shutil.copyfile(input_file, scratch_file)
+        with open(scratch_file, 'r+b') as f, mmap.mmap(f.fileno(), 0) as mm:
+            rows, cols, stride = grid_file_shape(mm)
+            full = (1 << cols) - 1
+            num_bands = -(-rows // band_rows)
+
+            # Halo rows whose neighbour across a band boundary changed,
+            # keyed by band, as global row numbers
+            pending = {}
+            total_removed = 0
+
+            def peel_band(band, dirty_rows=None):
+                # dirty_rows=None marks every row of the band dirty
+                first = band * band_rows
+                last = min(first + band_rows, rows)
+
+                # Local row i holds global row first - 1 + i
+                local = read_bitrows(mm, first - 1, last + 1, rows, cols, stride)
+                if dirty_rows is None:
+                    dirty = range(1, last - first + 1)
+                else:
+                    dirty = sorted(r - first + 1 for r in dirty_rows)
+                removed, changed = peel_bitrows(local, full, dirty, 1, last - first + 1)
+
+                for i in changed:
+                    write_bitrow(mm, first - 1 + i, local[i], cols, stride)
+                if 1 in changed and band > 0:
+                    pending.setdefault(band - 1, set()).add(first - 1)
+                if last - first in changed and band + 1 < num_bands:
+                    pending.setdefault(band + 1, set()).add(last)
+                return removed
+
+            # First pass: every row of every band is dirty, in order, so only
+            # the rows that cross a boundary ever need to be queued
+            for band in range(num_bands):
+                pending.pop(band, None)
+                total_removed += peel_band(band)
+
+            while pending:
+                band = min(pending)
+                total_removed += peel_band(band, pending.pop(band))
+    finally:
+        os.remove(scratch_file)
+
+    return total_removed
+
+
+# Part 1 and Part 2 implementations selectable from solve()
+ENGINES = {
+    'scan': (count_accessible_rolls, count_total_removable_rolls),
+    'worklist': (count_accessible_rolls, count_total_removable_rolls_worklist),
+    'numpy': (count_accessible_rolls_numpy, count_total_removable_rolls_numpy),
+    'bitpacked': (count_accessible_rolls_bitpacked, count_total_removable_rolls_bitpacked),
+}
+
+# Engines that work from the input file path instead of an in-memory grid
+FILE_ENGINES = {
+    'tiled': (count_accessible_rolls_tiled, count_total_removable_rolls_tiled),
+}
+
+
+def solve(input_file, engine='worklist'):
     """Read the input file and solve the puzzle."""
-    with open(input_file, 'r') as f:
-        grid = [line.rstrip('\n') for line in f]
-    
+    if engine in FILE_ENGINES:
+        # Out-of-core engines read the file themselves
+        grid = input_file
+        part1, part2 = FILE_ENGINES[engine]
+    else:
+        with open(input_file, 'r') as f:
+            grid = [line.rstrip('\n') for line in f]
+        part1, part2 = ENGINES[engine]
+
     # Part 1
-    result_part1 = count_accessible_rolls(grid)
+    result_part1 = part1(grid)
     print(f"Part 1 - Number of accessible rolls: {result_part1}")
     
     # Part 2
-    result_part2 = count_total_removable_rolls(grid)
+    result_part2 = part2(grid)
     print(f"Part 2 - Total rolls removed: {result_part2}")
     
     return result_part1, result_part2
 
 
 if __name__ == "__main__":
+    import sys
+
+    args = sys.argv[1:]
+    if '--engine' in args:
+        index = args.index('--engine')
+        engine = args[index + 1]
+        del args[index:index + 2]
+    else:
+        engine = 'worklist'
+
+    if args:
+        solve(args[0], engine=engine)
+        sys.exit(0)
+
     # Test with the example
     example_grid = [
         "..@@.@@@@.",
@@ -140,19 +537,31 @@ if __name__ == "__main__":
     print("=" * 50)
     
     # Part 1
-    example_result_part1 = count_accessible_rolls(example_grid)
+    if engine in FILE_ENGINES:
+        example_file = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+        with example_file:
+            example_file.write('\n'.join(example_grid) + '\n')
+        example_grid = example_file.name
+        part1, part2 = FILE_ENGINES[engine]
+    else:
+        part1, part2 = ENGINES[engine]
+
+    example_result_part1 = part1(example_grid)
     print(f"Part 1 - Example result: {example_result_part1}")
     print(f"Part 1 - Expected: 13")
     print()
     
     # Part 2
-    example_result_part2 = count_total_removable_rolls(example_grid)
+    example_result_part2 = part2(example_grid)
     print(f"Part 2 - Example result: {example_result_part2}")
     print(f"Part 2 - Expected: 43")
     print()
+
+    if engine in FILE_ENGINES:
+        os.remove(example_grid)
     
     # Solve the actual puzzle
     print("=" * 50)
     print("Solving puzzle:")
     print("=" * 50)
-    solve("input.txt")
+    solve("input.txt", engine=engine)
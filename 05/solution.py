@@ -1,3 +1,16 @@
+import os
+import random
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
+from math import isqrt
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for solve_numpy
+    np = None
+
 def parse_input(filename):
     with open(filename, 'r') as f:
         lines = f.read().splitlines()
@@ -26,6 +39,10 @@ def is_fresh(ingredient_id, ranges):
     return False
 
 def solve(filename):
+    ranges, ids = parse_input(filename)
+    return FreshIndex(ranges).count_fresh(ids)
+
+def solve_linear(filename):
     ranges, ids = parse_input(filename)
     fresh_count = 0
     
@@ -57,6 +74,171 @@ def merge_ranges(ranges):
     merged.append((current_start, current_end))
     return merged
 
+class FreshIndex:
+    """
+    Merged fresh ranges stored as parallel sorted start/end lists.
+    Single lookups are a bisect; batches are sorted and swept in one pass.
+    """
+
+    def __init__(self, ranges):
+        merged = merge_ranges(ranges)
+        self.starts = [start for start, _ in merged]
+        self.ends = [end for _, end in merged]
+
+    def __contains__(self, ingredient_id):
+        i = bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def classify(self, ids):
+        # Visit the IDs in sorted order so the range pointer only moves forward
+        order = sorted(range(len(ids)), key=ids.__getitem__)
+        fresh = [False] * len(ids)
+        starts, ends = self.starts, self.ends
+        i = 0
+
+        for position in order:
+            ingredient_id = ids[position]
+            while i < len(ends) and ends[i] < ingredient_id:
+                i += 1
+            if i == len(ends):
+                break
+            fresh[position] = starts[i] <= ingredient_id
+
+        return fresh
+
+    def count_fresh(self, ids):
+        return sum(self.classify(ids))
+
+    def total_fresh(self):
+        return sum(end - start + 1 for start, end in zip(self.starts, self.ends))
+
+class DynamicFreshSet(FreshIndex):
+    """
+    Mutable FreshIndex for fresh ranges that change over time.
+
+    The merged (disjoint, non-adjacent) ranges are kept as a blocked sorted
+    list: blocks of about sqrt(n) (start, end) pairs, each with its covered
+    ID count, located by bisecting the block maxima. add() and remove()
+    only touch the block they land in plus the ranges they merge away, so
+    an update costs O(log n + sqrt(n)) instead of splicing one flat list.
+    The covered ID count that solve_part2 reports is kept up to date
+    incrementally. remove() has set semantics: it makes every ID in
+    [start, end] stale, whichever ranges originally covered it.
+    """
+
+    def __init__(self, ranges=(), load=None):
+        merged = merge_ranges(ranges)
+        # Blocks hold between 1 and 2 * load ranges
+        self.load = load or max(64, isqrt(len(merged)))
+        self.blocks = [merged[i:i + self.load] for i in range(0, len(merged), self.load)]
+        self.maxes = [block[-1][1] for block in self.blocks]
+        self.block_totals = [self._covered(block) for block in self.blocks]
+        self.total = sum(self.block_totals)
+
+    @property
+    def starts(self):
+        return [start for block in self.blocks for start, _ in block]
+
+    @property
+    def ends(self):
+        return [end for block in self.blocks for _, end in block]
+
+    @staticmethod
+    def _covered(ranges):
+        return sum(end - start + 1 for start, end in ranges)
+
+    def _locate(self, value):
+        # (block, index) of the first range with end >= value
+        b = bisect_left(self.maxes, value)
+        if b == len(self.blocks):
+            return b, 0
+        return b, bisect_left(self.blocks[b], value, key=itemgetter(1))
+
+    def _refresh(self, lo, hi):
+        # Recompute maxima and totals of blocks lo..hi, dropping empty ones
+        for b in range(min(hi, len(self.blocks) - 1), lo - 1, -1):
+            block = self.blocks[b]
+            if block:
+                self.maxes[b] = block[-1][1]
+                self.block_totals[b] = self._covered(block)
+            else:
+                del self.blocks[b], self.maxes[b], self.block_totals[b]
+
+    def _take(self, b, i, limit):
+        # Remove and return the ranges from (b, i) onwards that start <= limit
+        taken = []
+        last = b
+        while last < len(self.blocks):
+            block = self.blocks[last]
+            first = i if last == b else 0
+            stop = bisect_right(block, limit, lo=first, key=itemgetter(0))
+            taken.extend(block[first:stop])
+            more = stop == len(block)
+            del block[first:stop]
+            if not more:
+                break
+            last += 1
+
+        if taken:
+            self._refresh(b, last)
+        return taken
+
+    def _insert(self, pieces):
+        # Insert disjoint ranges that overlap nothing currently in the set
+        if not self.blocks:
+            self.blocks.append([])
+            self.maxes.append(0)
+            self.block_totals.append(0)
+
+        b, i = self._locate(pieces[0][0])
+        if b == len(self.blocks):
+            b = len(self.blocks) - 1
+            i = len(self.blocks[b])
+
+        block = self.blocks[b]
+        block[i:i] = pieces
+        if len(block) > 2 * self.load:
+            half = len(block) // 2
+            self.blocks[b:b + 1] = [block[:half], block[half:]]
+            self.maxes[b:b + 1] = [0, 0]
+            self.block_totals[b:b + 1] = [0, 0]
+            self._refresh(b, b + 1)
+        else:
+            self._refresh(b, b)
+
+    def __contains__(self, ingredient_id):
+        b, i = self._locate(ingredient_id)
+        return b < len(self.blocks) and self.blocks[b][i][0] <= ingredient_id
+
+    def add(self, start, end):
+        # Ranges overlapping or adjacent to [start, end] collapse into one
+        taken = self._take(*self._locate(start - 1), end + 1)
+        if taken:
+            start = min(start, taken[0][0])
+            end = max(end, taken[-1][1])
+
+        self.total += (end - start + 1) - self._covered(taken)
+        self._insert([(start, end)])
+
+    def remove(self, start, end):
+        # Ranges overlapping [start, end] keep only the parts outside it
+        taken = self._take(*self._locate(start), end)
+        if not taken:
+            return
+
+        pieces = []
+        if taken[0][0] < start:
+            pieces.append((taken[0][0], start - 1))
+        if taken[-1][1] > end:
+            pieces.append((end + 1, taken[-1][1]))
+
+        self.total -= self._covered(taken) - self._covered(pieces)
+        if pieces:
+            self._insert(pieces)
+
+    def total_fresh(self):
+        return self.total
+
 def solve_part2(filename):
     ranges, _ = parse_input(filename)
     merged_ranges = merge_ranges(ranges)
@@ -67,15 +249,115 @@ def solve_part2(filename):
         
     return total_fresh
 
+def solve_stream(filename):
+    # One pass over the file: the first section builds the index, then IDs
+    # from the second section are classified as they are read
+    with open(filename, 'r') as f:
+        ranges = []
+        for line in f:
+            line = line.strip()
+            if not line:
+                break
+            start, end = map(int, line.split('-'))
+            ranges.append((start, end))
+
+        index = FreshIndex(ranges)
+        fresh_count = 0
+        for line in f:
+            line = line.strip()
+            if line and int(line) in index:
+                fresh_count += 1
+
+    return fresh_count, index.total_fresh()
+
+def parse_input_arrays(filename):
+    if np is None:
+        raise ImportError("solve_numpy requires NumPy")
+
+    with open(filename, 'r') as f:
+        text = f.read()
+
+    range_text, _, id_text = text.partition('\n\n')
+    ranges = np.fromstring(range_text.replace('-', '\n'), dtype=np.int64, sep='\n').reshape(-1, 2)
+    ids = np.fromstring(id_text, dtype=np.int64, sep='\n')
+    return ranges, ids
+
+def merge_ranges_array(ranges):
+    # Vectorized merge_ranges: a new merged range begins wherever a start is
+    # past the running maximum end of every range before it (+1 for adjacency)
+    if len(ranges) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    ranges = ranges[np.argsort(ranges[:, 0], kind='stable')]
+    starts, ends = ranges[:, 0], np.maximum.accumulate(ranges[:, 1])
+
+    new_group = np.empty(len(ranges), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = starts[1:] > ends[:-1] + 1
+
+    group_starts = np.flatnonzero(new_group)
+    group_ends = np.append(group_starts[1:], len(ranges)) - 1
+    return starts[group_starts], ends[group_ends]
+
+def fresh_mask(starts, ends, ids):
+    # One searchsorted finds the last merged range starting at or before each ID
+    if len(starts) == 0:
+        return np.zeros(len(ids), dtype=bool)
+    i = np.searchsorted(starts, ids, side='right') - 1
+    return (i >= 0) & (ids <= ends[np.maximum(i, 0)])
+
+def solve_numpy(filename):
+    ranges, ids = parse_input_arrays(filename)
+    starts, ends = merge_ranges_array(ranges)
+    mask = fresh_mask(starts, ends, ids)
+    return int(np.count_nonzero(mask)), mask
+
+def benchmark_numpy(num_ids=10**7, num_ranges=10**5, max_id=10**15, seed=0):
+    rng = random.Random(seed)
+    fd, filename = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            for _ in range(num_ranges):
+                start = rng.randrange(max_id)
+                f.write(f"{start}-{start + rng.randrange(max_id // num_ranges)}\n")
+            f.write('\n')
+            for _ in range(num_ids):
+                f.write(f"{rng.randrange(max_id)}\n")
+
+        started = time.perf_counter()
+        numpy_count, _ = solve_numpy(filename)
+        numpy_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        count = solve(filename)
+        solve_time = time.perf_counter() - started
+    finally:
+        os.remove(filename)
+
+    assert numpy_count == count, "solve_numpy and solve disagree"
+    print(f"{num_ids} IDs against {num_ranges} ranges: {count} fresh")
+    print(f"solve:       {solve_time:.2f}s")
+    print(f"solve_numpy: {numpy_time:.2f}s ({solve_time / numpy_time:.1f}x)")
+
 if __name__ == '__main__':
     import sys
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
+    if '--benchmark' in sys.argv[1:]:
+        counts = [int(arg) for arg in sys.argv[1:] if arg.isdigit()]
+        benchmark_numpy(*counts[:1])
+        sys.exit(0)
+
+    stream = '--stream' in sys.argv[1:]
+    args = [arg for arg in sys.argv[1:] if arg != '--stream']
+    if args:
+        filename = args[0]
     else:
         filename = 'Input.txt'
         
-    result_part1 = solve(filename)
+    if stream:
+        result_part1, result_part2 = solve_stream(filename)
+    else:
+        result_part1 = solve(filename)
+        result_part2 = solve_part2(filename)
+
     print(f"Part 1 - Number of fresh ingredients: {result_part1}")
-    
-    result_part2 = solve_part2(filename)
     print(f"Part 2 - Total fresh ingredient IDs: {result_part2}")
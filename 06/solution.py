@@ -1,14 +1,25 @@
 
+import mmap
+import os
 import sys
+from collections import deque
+from itertools import islice, zip_longest
+from multiprocessing import Pool
 
-def solve(input_file):
-    with open(input_file, 'r') as f:
-        lines = [line.rstrip('\n') for line in f.readlines()]
+try:
+    import numpy as np
+except ImportError:  # parse_problems_transposed falls back to zip_longest
+    np = None
 
-    if not lines:
-        print("No input lines.")
-        return
+def read_lines(input_file):
+    with open(input_file, 'r') as f:
+        return [line.rstrip('\n') for line in f.readlines()]
 
+def parse_problems(lines):
+    """
+    Split the worksheet into problems, returned as (start, end, operator,
+    numbers) tuples with numbers read vertically, right to left.
+    """
     # Ensure all lines are padded to the same length with spaces
     max_len = max(len(line) for line in lines)
     lines = [line.ljust(max_len) for line in lines]
@@ -42,13 +53,9 @@ def solve(input_file):
             problem_ranges.append((current_start, sep))
         current_start = sep + 1
 
-    grand_total = 0
-
-    print(f"Found {len(problem_ranges)} problems.")
-
-    for idx, (start, end) in enumerate(problem_ranges):
+    problems = []
+    for start, end in problem_ranges:
         numbers = []
-        operator = None
         
         # The last line (index num_rows - 1) contains the operator
         op_char = lines[num_rows - 1][start:end].strip()
@@ -64,30 +71,234 @@ def solve(input_file):
             
             if digit_str:
                 numbers.append(int(digit_str))
-        
-        if not op_char:
-             print(f"Problem {idx}: No operator found in range {start}-{end}")
-             continue
-             
-        operator = op_char
-        
-        result = 0
-        if operator == "+":
-            result = sum(numbers)
-        elif operator == "*":
-            result = 1
-            for n in numbers:
-                result *= n
-        else:
-            print(f"Problem {idx}: Unknown operator '{operator}'")
-
-        # print(f"Problem {idx}: {numbers} {operator} = {result}")
-        grand_total += result
+
+        problems.append((start, end, op_char, numbers))
+
+    return problems
+
+def parse_problems_transposed(lines):
+    """
+    Same result as parse_problems, working column-major on the transposed
+    sheet. With NumPy the sheet becomes a byte matrix: separators are one
+    all-spaces test over axis 0 and every column's number is built by
+    folding the digit rows together. Without NumPy the columns come from a
+    single zip_longest over the lines.
+    """
+    if np is None:
+        columns = [''.join(column) for column in zip_longest(*lines, fillvalue=' ')]
+        is_sep = [not column.strip() for column in columns]
+        values = [int(column[:-1].replace(' ', '') or 0) for column in columns]
+        has_digits = [bool(column[:-1].strip()) for column in columns]
+        operators = ''.join(column[-1] for column in columns)
+    else:
+        num_rows = len(lines)
+        num_cols = max(len(line) for line in lines)
+        sheet = np.full((num_rows, num_cols), ord(' '), dtype=np.uint8)
+        for r, line in enumerate(lines):
+            sheet[r, :len(line)] = np.frombuffer(line.encode(), dtype=np.uint8)
+
+        is_sep = (sheet == ord(' ')).all(axis=0)
+
+        # Fold the digit rows top to bottom; spaces are skipped
+        digits = sheet[:-1].astype(np.int64) - ord('0')
+        is_digit = (digits >= 0) & (digits <= 9)
+        values = np.zeros(num_cols, dtype=np.int64 if num_rows - 1 <= 18 else object)
+        for r in range(num_rows - 1):
+            values = np.where(is_digit[r], values * 10 + digits[r], values)
+        has_digits = is_digit.any(axis=0)
+
+        is_sep, values, has_digits = is_sep.tolist(), values.tolist(), has_digits.tolist()
+        operators = sheet[-1].tobytes().decode()
+
+    problems = []
+    start = 0
+    for col in range(len(is_sep) + 1):
+        if col < len(is_sep) and not is_sep[col]:
+            continue
+        if col > start:
+            numbers = [values[c] for c in range(col - 1, start - 1, -1) if has_digits[c]]
+            problems.append((start, col, operators[start:col].strip(), numbers))
+        start = col + 1
+
+    return problems
+
+def iter_problems_stream(input_file, chunk_cols=1 << 16):
+    """
+    Yield problems from the worksheet one at a time, without loading or
+    padding the whole sheet.
+
+    The file is memory-mapped and every row is read in step, chunk_cols
+    columns at a time, from its own offset. Columns are collected into the
+    current block until an all-space column confirms the block is complete,
+    so memory is bounded by the widest block plus one chunk per row.
+    """
+    with open(input_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # (offset, length) of every row
+            rows = []
+            pos = 0
+            while pos < size:
+                newline = mm.find(b'\n', pos)
+                if newline == -1:
+                    newline = size
+                rows.append((pos, newline - pos))
+                pos = newline + 1
+
+            width = max(length for _, length in rows)
+            block = []
+            block_start = 0
+
+            for chunk_start in range(0, width, chunk_cols):
+                chunk_end = min(chunk_start + chunk_cols, width)
+                pieces = [
+                    mm[offset + chunk_start:offset + min(chunk_end, length)].decode().ljust(chunk_end - chunk_start)
+                    for offset, length in rows
+                ]
+
+                for col, column in enumerate(zip(*pieces), start=chunk_start):
+                    column = ''.join(column)
+                    if column.strip():
+                        if not block:
+                            block_start = col
+                        block.append(column)
+                    elif block:
+                        yield block_to_problem(block_start, block)
+                        block = []
+
+            if block:
+                yield block_to_problem(block_start, block)
+
+def block_to_problem(start, columns):
+    """Turn the column strings of one block into a (start, end, operator, numbers) problem."""
+    op_char = ''.join(column[-1] for column in columns).strip()
+    numbers = []
+    for column in reversed(columns):
+        digit_str = ''.join(column[:-1].split())
+        if digit_str:
+            numbers.append(int(digit_str))
+    return start, start + len(columns), op_char, numbers
+
+PARSERS = {
+    'scan': parse_problems,
+    'transposed': parse_problems_transposed,
+}
+
+def product_tree(numbers):
+    """
+    Multiply numbers pairwise in a balanced tree. Operands at each level have
+    similar sizes, which keeps big-integer multiplication from going
+    quadratic the way a running left-to-right product does.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+def evaluate_problem(idx, start, end, op_char, numbers):
+    if not op_char:
+         print(f"Problem {idx}: No operator found in range {start}-{end}")
+         return 0
+         
+    operator = op_char
+    
+    result = 0
+    if operator == "+":
+        result = sum(numbers)
+    elif operator == "*":
+        result = product_tree(numbers)
+    else:
+        print(f"Problem {idx}: Unknown operator '{operator}'")
+
+    # print(f"Problem {idx}: {numbers} {operator} = {result}")
+    return result
+
+def solve(input_file, parser='transposed'):
+    lines = read_lines(input_file)
+
+    if not lines:
+        print("No input lines.")
+        return
+
+    problems = PARSERS[parser](lines)
+
+    grand_total = 0
+
+    print(f"Found {len(problems)} problems.")
+
+    for idx, problem in enumerate(problems):
+        grand_total += evaluate_problem(idx, *problem)
 
     print(f"Grand Total: {grand_total}")
 
+    return grand_total
+
+def solve_stream(input_file):
+    grand_total = 0
+    count = 0
+
+    for idx, problem in enumerate(iter_problems_stream(input_file)):
+        grand_total += evaluate_problem(idx, *problem)
+        count += 1
+
+    print(f"Found {count} problems.")
+    print(f"Grand Total: {grand_total}")
+
+    return grand_total
+
+def evaluate_batch(batch):
+    """Pool worker: total of a batch of (idx, problem) pairs."""
+    return sum(evaluate_problem(idx, *problem) for idx, problem in batch)
+
+def solve_parallel(input_file, processes=None, batch_size=64):
+    """
+    Evaluate independent problem blocks on a process pool. Blocks are
+    streamed from the sheet in batches, with at most two batches per
+    process in flight, and the batch totals are summed at the end.
+    """
+    processes = processes or os.cpu_count() or 1
+    problems = enumerate(iter_problems_stream(input_file))
+    grand_total = 0
+    count = 0
+    pending = deque()
+
+    with Pool(processes) as pool:
+        while True:
+            batch = list(islice(problems, batch_size))
+            if not batch:
+                break
+            count += len(batch)
+            if len(pending) >= 2 * processes:
+                grand_total += pending.popleft().get()
+            pending.append(pool.apply_async(evaluate_batch, (batch,)))
+        while pending:
+            grand_total += pending.popleft().get()
+
+    print(f"Found {count} problems.")
+    print(f"Grand Total: {grand_total}")
+
+    return grand_total
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        solve(sys.argv[1])
+    args = sys.argv[1:]
+    parser = 'transposed'
+    if '--parser' in args:
+        index = args.index('--parser')
+        parser = args[index + 1]
+        del args[index:index + 2]
+
+    input_file = args[0] if args else "input.txt"
+    if parser == 'stream':
+        solve_stream(input_file)
+    elif parser == 'parallel':
+        solve_parallel(input_file)
     else:
-        solve("input.txt")
+        solve(input_file, parser=parser)
@@ -1,62 +1,77 @@
 
+import heapq
 import sys
+from bisect import bisect_left
 
-def solve():
-    filename = 'input.txt'
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
-    try:
-        with open(filename, 'r') as f:
-            grid = [line.strip() for line in f if line.strip()]
-    except FileNotFoundError:
-        print("input.txt not found")
-        return
+from collections import defaultdict
 
-    # Find S
-    sx, sy = -1, -1
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the 'dense' engine
+    np = None
+
+# Past this, one more row (at most three contributions per cell) could
+# overflow uint64, so the dense engine switches to Python ints
+DENSE_OVERFLOW_LIMIT = 2 ** 62
+
+
+def find_start(grid):
     for r, row in enumerate(grid):
         if 'S' in row:
-            sx = row.index('S')
-            sy = r
-            break
-            
-    if sx == -1:
-        print("S not found")
-        return
+            return row.index('S'), r
+    return -1, -1
+
 
-    # Part 1 Logic
-    # beams = {sx}
-    # total_splits = 0
-    # height = len(grid)
-    # width = len(grid[0])
+def step_row(active_timelines, row, width):
+    # Advance the timelines through one row: returns the timelines entering
+    # the next row, the splits in this row and the timelines that exited
+    next_active = defaultdict(int)
+    splits = 0
+    exited = 0
     
-    # for y in range(sy + 1, height):
-    #     row = grid[y]
-    #     next_beams = set()
-    #     
-    #     for x in beams:
-    #         if x < 0 or x >= len(row):
-    #             continue
-    #             
-    #         char = row[x]
-    #         if char == '^':
-    #             total_splits += 1
-    #             next_beams.add(x - 1)
-    #             next_beams.add(x + 1)
-    #         else:
-    #             next_beams.add(x)
-    #     
-    #     beams = next_beams
-
-    # Part 2 Logic - Count Timelines
-    from collections import defaultdict
+    for x, count in active_timelines.items():
+        # If x is currently in active_timelines, it is IN BOUNDS and valid for row y
+        # (Check bounds just in case, though logically should be filtered)
+        if not (0 <= x < width):
+            # Should have been caught in previous iteration, but for safety:
+            exited += count
+            continue
+            
+        char = row[x]
+        
+        if char == '^':
+            # Split: timelines go to x-1 and x+1 in the NEXT row (y+1)
+            # Note: The split adds count to both branches.
+            splits += 1
+            next_active[x - 1] += count
+            next_active[x + 1] += count
+        else:
+            # '.' or 'S': continues downward to x in NEXT row (y+1)
+            next_active[x] += count
     
+    # Filter for valid bounds and update active_timelines for next iteration
+    active_timelines = defaultdict(int)
+    for x, count in next_active.items():
+        if 0 <= x < width:
+            active_timelines[x] = count
+        else:
+            # Exited the manifold sideways (or strictly, failed to enter next row)
+            exited += count
+
+    return active_timelines, splits, exited
+
+
+def propagate(grid, sx, sy):
+    # One sweep for both parts: returns (total_splits, completed_timelines).
+    # Part 1 beams merge, so they are exactly the columns holding at least
+    # one timeline, and every splitter reached by a timeline counts once.
     # Active timelines mapped by x-coordinate: {x: count}
     # Initial state: 1 timeline at S
     active_timelines = defaultdict(int) 
     active_timelines[sx] = 1
     
     completed_timelines = 0
+    total_splits = 0
     height = len(grid)
     width = len(grid[0])
     
@@ -67,42 +82,212 @@ def solve():
     # Note: loop should handle "S" appropriately (handled as default case aka '.')
     
     for y in range(sy, height):
-        next_active = defaultdict(int)
-        row = grid[y]
-        
-        for x, count in active_timelines.items():
-            # If x is currently in active_timelines, it is IN BOUNDS and valid for row y
-            # (Check bounds just in case, though logically should be filtered)
-            if not (0 <= x < width):
-                # Should have been caught in previous iteration, but for safety:
-                completed_timelines += count
-                continue
-                
-            char = row[x]
-            
-            if char == '^':
-                # Split: timelines go to x-1 and x+1 in the NEXT row (y+1)
-                # Note: The split adds count to both branches.
-                next_active[x - 1] += count
-                next_active[x + 1] += count
-            else:
-                # '.' or 'S': continues downward to x in NEXT row (y+1)
-                next_active[x] += count
-        
-        # Filter for valid bounds and update active_timelines for next iteration
-        active_timelines = defaultdict(int)
-        for x, count in next_active.items():
-            if 0 <= x < width:
-                active_timelines[x] = count
-            else:
-                # Exited the manifold sideways (or strictly, failed to enter next row)
-                completed_timelines += count
+        active_timelines, splits, exited = step_row(active_timelines, grid[y], width)
+        total_splits += splits
+        completed_timelines += exited
 
     # Any particles still in active_timelines after processing the last row 
     # have effectively exited the bottom of the manifold
     completed_timelines += sum(active_timelines.values())
 
+    return total_splits, completed_timelines
+
+
+def propagate_stream(lines):
+    # Same sweep as propagate, fed one row at a time from any iterable of
+    # lines (a file, stdin or a generator), so only the current row and the
+    # active timelines are ever in memory. Returns None if there is no S.
+    rows = (line.strip() for line in lines)
+    rows = (row for row in rows if row)
+
+    width = None
+    for row in rows:
+        if width is None:
+            width = len(row)
+        if 'S' in row:
+            sx = row.index('S')
+            break
+    else:
+        return None
+
+    active_timelines = defaultdict(int)
+    active_timelines[sx] = 1
+    completed_timelines = 0
+    total_splits = 0
+
+    # The S row itself is processed first, like propagate does from sy
+    active_timelines, splits, exited = step_row(active_timelines, row, width)
+    total_splits += splits
+    completed_timelines += exited
+
+    for row in rows:
+        active_timelines, splits, exited = step_row(active_timelines, row, width)
+        total_splits += splits
+        completed_timelines += exited
+
+    completed_timelines += sum(active_timelines.values())
+    return total_splits, completed_timelines
+
+
+def splitter_mask(row, width):
+    # Boolean mask of the '^' cells in a row, padded or cut to width
+    cells = np.frombuffer(row[:width].encode(), dtype=np.uint8)
+    mask = np.zeros(width, dtype=bool)
+    mask[:len(cells)] = cells == ord('^')
+    return mask
+
+
+def propagate_dense(grid, sx, sy):
+    # Same sweep as propagate, with the timelines held in one
+    # fixed-width array: each row is a mask of splitters and two shifted adds.
+    # Counts live in uint64 until they get close to overflowing, then in a
+    # Python-int object array.
+    if np is None:
+        raise ImportError("the 'dense' engine requires NumPy")
+
+    width = len(grid[0])
+    counts = np.zeros(width, dtype=np.uint64)
+    counts[sx] = 1
+    completed_timelines = 0
+    total_splits = 0
+
+    for y in range(sy, len(grid)):
+        if counts.dtype != object and counts.max() >= DENSE_OVERFLOW_LIMIT:
+            counts = np.array([int(count) for count in counts], dtype=object)
+
+        mask = splitter_mask(grid[y], width)
+        mask &= counts != 0
+        total_splits += int(np.count_nonzero(mask))
+        split = np.where(mask, counts, 0).astype(counts.dtype)
+        counts = np.where(mask, 0, counts).astype(counts.dtype)
+
+        # Split timelines move to x-1 and x+1; the outermost ones leave sideways
+        counts[:-1] += split[1:]
+        counts[1:] += split[:-1]
+        completed_timelines += int(split[0]) + int(split[-1])
+
+    completed_timelines += sum(int(count) for count in counts)
+    return total_splits, completed_timelines
+
+
+def build_splitter_index(grid, width):
+    # For every column, the sorted rows holding a '^'
+    columns = [[] for _ in range(width)]
+    for y, row in enumerate(grid):
+        x = row.find('^', 0, width)
+        while x != -1:
+            columns[x].append(y)
+            x = row.find('^', x + 1, width)
+    return columns
+
+
+def propagate_sparse(grid, sx, sy):
+    # Same result as propagate, but work scales with splitter hits
+    # instead of height * active columns. A bucket of timelines in column x
+    # jumps straight to the next splitter below it (found by bisecting that
+    # column's splitter rows); buckets landing on the same splitter merge,
+    # and splitters are processed in row order from a heap. Every splitter
+    # popped is one Part 1 split.
+    width = len(grid[0])
+    columns = build_splitter_index(grid, width)
+
+    events = {}  # (row, x) of a splitter -> timelines arriving at it
+    heap = []
+    completed_timelines = 0
+
+    def drop(x, from_row, count):
+        nonlocal completed_timelines
+        if not (0 <= x < width):
+            # Left the manifold sideways
+            completed_timelines += count
+            return
+
+        rows = columns[x]
+        i = bisect_left(rows, from_row)
+        if i == len(rows):
+            # No splitter below: falls out of the bottom
+            completed_timelines += count
+            return
+
+        key = (rows[i], x)
+        if key not in events:
+            events[key] = 0
+            heapq.heappush(heap, key)
+        events[key] += count
+
+    total_splits = 0
+    drop(sx, sy, 1)
+    while heap:
+        total_splits += 1
+        y, x = key = heapq.heappop(heap)
+        count = events.pop(key)
+        drop(x - 1, y + 1, count)
+        drop(x + 1, y + 1, count)
+
+    return total_splits, completed_timelines
+
+
+ENGINES = {
+    'dict': propagate,
+    'dense': propagate_dense,
+    'sparse': propagate_sparse,
+}
+
+
+def solve(filename='input.txt', engine='dense'):
+    try:
+        with open(filename, 'r') as f:
+            grid = [line.strip() for line in f if line.strip()]
+    except FileNotFoundError:
+        print("input.txt not found")
+        return
+
+    # Find S
+    sx, sy = find_start(grid)
+    if sx == -1:
+        print("S not found")
+        return
+
+    # Part 1 (split count) and Part 2 (timelines) come from the same sweep
+    total_splits, completed_timelines = ENGINES[engine](grid, sx, sy)
+
+    print(f"Total splits: {total_splits}")
+    print(f"Total timelines: {completed_timelines}")
+    return total_splits, completed_timelines
+
+
+def solve_stream(filename='input.txt'):
+    # Streaming mode: '-' reads the manifold from stdin
+    try:
+        if filename == '-':
+            result = propagate_stream(sys.stdin)
+        else:
+            with open(filename, 'r') as f:
+                result = propagate_stream(f)
+    except FileNotFoundError:
+        print("input.txt not found")
+        return
+
+    if result is None:
+        print("S not found")
+        return
+
+    total_splits, completed_timelines = result
+    print(f"Total splits: {total_splits}")
     print(f"Total timelines: {completed_timelines}")
+    return total_splits, completed_timelines
+
 
 if __name__ == '__main__':
-    solve()
+    args = sys.argv[1:]
+    engine = 'dense'
+    if '--engine' in args:
+        index = args.index('--engine')
+        engine = args[index + 1]
+        del args[index:index + 2]
+
+    filename = args[0] if args else 'input.txt'
+    if engine == 'stream':
+        solve_stream(filename)
+    else:
+        solve(filename, engine=engine)